@@ -2,7 +2,6 @@
 # Automatic interface for the `argparse` module.
 
 # MARK: Imports
-import os
 import argparse
 from pathlib import Path
 from typing import Optional, Any, Iterable
@@ -11,6 +10,7 @@ from textual import on
 from textual.app import App, SystemCommand, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, Horizontal
+from textual.widget import Widget
 from textual.widgets import Header, Footer, TabbedContent, TabPane, Label, Switch, Select, Input, Button, Tree, Link
 
 from . import Utils
@@ -32,7 +32,8 @@ class Interface(App):
     Use `Wrapper` to automatically handle the interface.
     """
     # MARK: Constants
-    CSS_PATH = os.path.join(os.path.dirname(__file__), "style", "Interface.tcss")
+    CSS_PATH = str(Path(__file__).parent / "style" / "Interface.tcss")
+    _CSS_EXISTS = Path(CSS_PATH).exists() # Checked once at import; the path is static per install
 
     ID_SUBMIT_BTN = "submitButton"
     ID_NAV_AREA = "navArea"
@@ -45,7 +46,7 @@ class Interface(App):
     CLASS_NAV_INPUT = "navInput"
     CLASS_INPUT_LIST = "inputList"
 
-    BINDINGS = {
+    BINDINGS = (
         Binding(
             "ctrl+q",
             "onQuit",
@@ -64,7 +65,7 @@ class Interface(App):
             priority=True,
             system=True
         )
-    }
+    )
 
     # MARK: Constructor
     def __init__(self,
@@ -91,12 +92,44 @@ class Interface(App):
 
         self._icon = icon
         self._parserMap = ParserMap(parser)
+        self._validActionsCache: dict[int, tuple[argparse.Action, ...]] = {} # { id(actions list) : filtered actions }
+
+        # Precompute the gui-filtered action partitions; the parser tree and `guiFlag` are immutable from here
+        self._groupValidActions: dict[str, tuple[tuple[argparse.Action, ...], tuple[argparse.Action, ...]]] = {
+            group.id: (
+                tuple(self._onlyValidActions(group.reqActions)),
+                tuple(self._onlyValidActions(group.optActions))
+            )
+            for group in self._parserMap.groupMap
+        } # { group id : (required actions, optional actions) }
+
+        # Precompute the display labels for each group in `groupMap` order
+        self._groupLabels: tuple[str, ...] = tuple(
+            (f"Section {groupIndex + 1}" if group.isUuidTitle else Utils.toTitleCase(group.title))
+            for groupIndex, group in enumerate(self._parserMap.groupMap)
+        )
+
+        # Map action types to their input builders for O(1) dispatch
+        self._actionBuilders: dict[type, Any] = {
+            argparse._StoreTrueAction: InputBuilders.buildSwitchInput,
+            argparse._StoreFalseAction: InputBuilders.buildSwitchInput,
+            argparse._SubParsersAction: self._buildSubparserGroup,
+            argparse._StoreAction: self._buildStoreActionInput
+        } # { action type : builder generator }
+
+        self._validDestsCache: dict[int, list[str]] = {} # { id(parser) : valid dests }
+        self._validDestsDirty = True
         self._commands: dict[str, Optional[Any]] = {}
-        self._listsData: dict[str, tuple[argparse.Action, dict[str, Any]]] = {} # { list id : (action, { list item id : list item }) }
+        self._initCommands(parser) # TODO: Load values from previous run?
+        self._pendingUpdates: dict[str, Optional[Any]] = {} # Keystroke updates awaiting a single flush into `_commands`
+        self._flushTimer = None
+        self._lazySubparsers: dict[str, argparse.ArgumentParser] = {} # { tab pane id : parser awaiting build }
+        self._tabTargets: dict[str, tuple[str, str]] = {} # { tab pane id : (action dest, parser key) }
+        self._debugLog = ("devtools" in self.features) # Skip building debug log strings when nothing is listening
         self.__initTabsContent: Optional[dict[str, list[argparse.Action]]] = {} # { tab id : [ action, ... ] }; deleted after use
 
         # Check for the css
-        if not os.path.exists(self.CSS_PATH):
+        if not self._CSS_EXISTS:
             self.log(error=f"Could not find the css file at: {self.CSS_PATH}")
 
     # MARK: Lifecycle
@@ -165,21 +198,16 @@ class Interface(App):
 
         # Populate the tree
         for groupIndex, group in enumerate(self._parserMap.groupMap):
-            # Choose a title
-            if group.isUuidTitle:
-                groupTitle = f"Section {groupIndex + 1}"
-            else:
-                groupTitle = Utils.toTitleCase(group.title)
-
             # Add the group branch
             groupBranch = tree.root.add(
-                groupTitle,
+                self._groupLabels[groupIndex],
                 expand=True,
                 data=(self.CLASS_NAV_SECTION, group.title)
             )
 
             # Add the actions
-            for action in self._onlyValidActions(group.allActions()):
+            reqActions, optActions = self._groupValidActions[group.id]
+            for action in (reqActions + optActions):
                 # Build the info text
                 infoText = ""
                 if ParserGroup.isActionRequired(action):
@@ -243,10 +271,7 @@ class Interface(App):
                 )
 
             # Add title
-            if group.isUuidTitle:
-                container.border_title = f"Section {groupIndex + 1}"
-            else:
-                container.border_title = Utils.toTitleCase(group.title)
+            container.border_title = self._groupLabels[groupIndex]
 
             # Send it
             yield container
@@ -257,19 +282,18 @@ class Interface(App):
 
         group: The `ParserGroup` to build the UI elements from.
         """
+        # Get the precomputed partitions
+        reqActions, optActions = self._groupValidActions[group.id]
+
         # Create the required actions as needed
-        if group.reqActions:
+        if reqActions:
             yield Label("Required", classes="sectionTitle")
-            yield from self._buildActionInputs(
-                self._onlyValidActions(group.reqActions)
-            )
+            yield from self._buildActionInputs(reqActions)
 
         # Create the optional actions as needed
-        if group.optActions:
+        if optActions:
             yield Label("Optional", classes="sectionTitle")
-            yield from self._buildActionInputs(
-                self._onlyValidActions(group.optActions)
-            )
+            yield from self._buildActionInputs(optActions)
 
     def _buildTabbedGroupSections(self, group: ParserGroup):
         """
@@ -313,53 +337,54 @@ class Interface(App):
         """
         # Loop through the parser actions
         for action in actions:
-            # Record the parser key
-            if action.dest in self._commands:
-                self.log(warn=f"Duplicate command found: {action.dest}")
-
-            self._commands[action.dest] = (action.default or None) # TODO: Load values from previous run?
-
             # Decide what UI to show
             # TODO: Check argparse docs to find any missing deliniations
-            if isinstance(action, (argparse._StoreTrueAction, argparse._StoreFalseAction)):
-                # Add a switch
-                yield from InputBuilders.buildSwitchInput(action)
-            elif isinstance(action, argparse._SubParsersAction):
-                # Add a subparser group
-                yield from self._buildSubparserGroup(action)
-            elif isinstance(action, argparse._StoreAction):
-                # Decide based on expected type and properties
-                if (action.choices is not None):
-                    # Add a combo box input
-                    yield from InputBuilders.buildDropdownInput(action)
-                elif ((action.nargs == argparse.ONE_OR_MORE) or
-                      (action.nargs == argparse.ZERO_OR_MORE) or
-                      (isinstance(action.nargs, int) and (action.nargs > 1))):
-                    # Add a list input
-                    yield InputList(
-                        action,
-                        (not (isinstance(action.nargs, int) and (action.nargs > 1))),
-                        defaults=self._commands.get(action.dest, []),
-                        classes=self.CLASS_INPUT_LIST
-                    )
-                elif action.type == int:
-                    # Add an int input
-                    yield from InputBuilders.buildTypedInput(action, inputType="integer")
-                elif action.type == float:
-                    # Add a float input
-                    yield from InputBuilders.buildTypedInput(action, inputType="number")
-                elif ((action.type == Path) or
-                      isinstance(action.type, FileSelectFile) or
-                      isinstance(action.type, FileSelectDir)):
-                    # Add a file input
-                    yield from InputBuilders.buildFileSelectInput(action)
+            builder = self._actionBuilders.get(type(action))
+            if builder is not None:
+                # Builders produce either a single widget or a generator of widgets
+                built = builder(action)
+                if isinstance(built, Widget):
+                    yield built
                 else:
-                    # Add a string input
-                    yield from InputBuilders.buildTypedInput(action)
+                    yield from built
             else:
                 # Report
                 self.log(warn=f"Unknown action type: {action}")
 
+    def _buildStoreActionInput(self, action: argparse.Action) -> Widget:
+        """
+        Returns the UI element for a standard store `argparse.Action` object based on its expected type and properties.
+
+        action: The `argparse._StoreAction` object to build the UI element from.
+        """
+        if (action.choices is not None):
+            # Add a combo box input
+            return InputBuilders.buildDropdownInput(action)
+        elif ((action.nargs == argparse.ONE_OR_MORE) or
+              (action.nargs == argparse.ZERO_OR_MORE) or
+              (isinstance(action.nargs, int) and (action.nargs > 1))):
+            # Add a list input
+            return InputList(
+                action,
+                (not (isinstance(action.nargs, int) and (action.nargs > 1))),
+                defaults=self._commands.get(action.dest, []),
+                classes=self.CLASS_INPUT_LIST
+            )
+        elif action.type == int:
+            # Add an int input
+            return InputBuilders.buildTypedInput(action, inputType="integer")
+        elif action.type == float:
+            # Add a float input
+            return InputBuilders.buildTypedInput(action, inputType="number")
+        elif ((action.type == Path) or
+              isinstance(action.type, FileSelectFile) or
+              isinstance(action.type, FileSelectDir)):
+            # Add a file input
+            return InputBuilders.buildFileSelectInput(action)
+        else:
+            # Add a string input
+            return InputBuilders.buildTypedInput(action)
+
     def _buildSubparserGroup(self, action: argparse.Action):
         """
         Yields a subparser group for the given `action`.
@@ -400,60 +425,110 @@ class Interface(App):
         parserKey: str
         parser: argparse.ArgumentParser
         for parserKey, parser in action.choices.items():
-            # Build the tab contents
-            children = []
+            # Create an empty tab and defer the contents until the tab is first activated
+            paneId = f"{action.dest}_{parserKey}"
+            self._lazySubparsers[paneId] = parser
+            self._tabTargets[paneId] = (action.dest, parserKey)
 
-            if parser.description:
-                children.append(Label(parser.description))
-
-            children.extend(self._buildActionInputs(self._onlyValidActions(parser._actions)))
-
-            # Create the tab
             newTab = TabPane(
                 parserKey,
-                *children,
-                id=f"{action.dest}_{parserKey}"
+                id=paneId
             )
 
             # Add the tab
             self.get_widget_by_id(tabsId).add_pane(newTab)
 
+    def _installLazySubparserContent(self, paneId: str) -> None:
+        """
+        Builds and mounts the contents of a lazily created subparser `TabPane` object.
+        Does nothing if the pane's content has already been built.
+
+        paneId: The id of the `TabPane` object to fill.
+        """
+        # Check if the pane is awaiting its content
+        parser = self._lazySubparsers.pop(paneId, None)
+        if parser is None:
+            return
+
+        # Build the tab contents
+        children = []
+
+        if parser.description:
+            children.append(Label(parser.description))
+
+        children.extend(self._buildActionInputs(self._onlyValidActions(parser._actions)))
+
+        # Mount the contents
+        self.get_widget_by_id(paneId).mount_all(children)
+
     # MARK: Functions
     def getArgs(self) -> argparse.Namespace:
         """
         Returns the arguments parsed from the interface.
         """
+        # Apply anything still waiting on the debounce timer
+        self._flushCommands()
+
         # Scope to only active command data
-        validDests = self._getValidDests(self._parserMap.parser)
+        validDests = set(self._getValidDests(self._parserMap.parser))
+        self._validDestsDirty = False
 
-        # Filter out any inactive commands
+        # Filter out any inactive commands; list-based commands already arrive as flat lists from their widgets
         filteredCmds = {k: v for k, v in self._commands.items() if k in validDests}
 
-        # Flatten list-based commands
-        for id in self._listsData.keys():
-            # Check if a dict that needs to be flattened
-            if (id in filteredCmds) and isinstance(filteredCmds[id], dict):
-                # Build the update
-                cmdUpdate = [v for v in filteredCmds[id].values()]
-
-                # Apply the update
-                filteredCmds[id] = cmdUpdate
-
-        # return filteredCmds
         return argparse.Namespace(**filteredCmds)
 
     # MARK: Private Functions
-    def _onlyValidActions(self, actions: list[argparse.Action]) -> list[argparse.Action]:
+    def _flushCommands(self) -> None:
+        """
+        Applies any pending typed-input updates to the command store in one pass.
+        """
+        self._flushTimer = None
+        if self._pendingUpdates:
+            self._commands.update(self._pendingUpdates)
+            if self._debugLog:
+                self.log(debug=f"Text changed: {self._pendingUpdates}")
+            self._pendingUpdates.clear()
+
+    def _initCommands(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Populates `self._commands` with the default value of every action in the given parser chain.
+        Called once at construction so building the UI stays pure rendering.
+
+        parser: The `argparse.ArgumentParser` object to pull the defaults from.
+        """
+        for action in self._onlyValidActions(parser._actions):
+            # Record the default, preserving falsy values like `0` and `False`
+            self._commands[action.dest] = (action.default if (action.default is not argparse.SUPPRESS) else None)
+
+            # Check if a subparser; identity check since argparse actions are concrete leaf classes
+            if type(action) is argparse._SubParsersAction:
+                # Seed the subparser branches
+                for subParser in action.choices.values():
+                    self._initCommands(subParser)
+
+    def _onlyValidActions(self, actions: list[argparse.Action]) -> tuple[argparse.Action, ...]:
         """
         Gets the valid actions for the given `ArgumentParser` using rules from this Interface.
+        Results are cached per actions list since the parser tree and `guiFlag` are immutable.
         """
-        return ParserMap.excludeActionByDest(
+        # Check for a cached result
+        cacheKey = id(actions)
+        cached = self._validActionsCache.get(cacheKey)
+        if cached is not None:
+            return cached
+
+        # Filter and cache
+        result = tuple(ParserMap.excludeActionByDest(
             actions,
             keepHelp=False,
             excludes=[
                 self.guiFlag
             ]
-        )
+        ))
+        self._validActionsCache[cacheKey] = result
+
+        return result
 
     def _getValidDests(self, parser: argparse.ArgumentParser) -> list[str]:
         """
@@ -461,11 +536,16 @@ class Interface(App):
 
         parser: The parser to get the valid destinations from.
         """
+        # Use the cached result if nothing relevant changed
+        cacheKey = id(parser)
+        if (not self._validDestsDirty) and (cacheKey in self._validDestsCache):
+            return self._validDestsCache[cacheKey]
+
         # Loop through the actions
         validDests = []
         for action in self._onlyValidActions(parser._actions):
             # Check if a subparser
-            if isinstance(action, argparse._SubParsersAction):
+            if type(action) is argparse._SubParsersAction:
                 # Check if present
                 if action.dest in self._commands:
                     # Loop through subparsers
@@ -481,6 +561,9 @@ class Interface(App):
                 # Regular action
                 validDests.append(action.dest)
 
+        # Cache for repeat calls
+        self._validDestsCache[cacheKey] = validDests
+
         return validDests
 
     def _exportDOM(self) -> None:
@@ -501,6 +584,9 @@ class Interface(App):
         """
         Triggers when the user submits the form.
         """
+        # Apply anything still waiting on the debounce timer before validating
+        self._flushCommands()
+
         # Check if all required fields are filled
         # TODO: Add deeper validation checking (piggyback on argparse?)
         reqActions = self._parserMap.allRequiredActions()
@@ -524,7 +610,9 @@ class Interface(App):
         Triggered when an input switch is changed.
         """
         self._commands[event.switch.id] = event.value
-        self.log(debug=f"Switch changed: {event.switch.id} -> {event.value}")
+        self._validDestsDirty = True
+        if self._debugLog:
+            self.log(debug=f"Switch changed: {event.switch.id} -> {event.value}")
 
     @on(Select.Changed, f".{InputBuilders.CLASS_DROPDOWN}")
     def inputDropdownChanged(self, event: Select.Changed) -> None:
@@ -532,7 +620,9 @@ class Interface(App):
         Triggered when an input dropdown is changed.
         """
         self._commands[event.select.id] = event.value
-        self.log(debug=f"Dropdown changed: {event.select.id} -> {event.value}")
+        self._validDestsDirty = True
+        if self._debugLog:
+            self.log(debug=f"Dropdown changed: {event.select.id} -> {event.value}")
 
     @on(Input.Changed, f".{InputBuilders.CLASS_TYPED_TEXT}")
     def inputTypedChanged(self, event: Input.Changed) -> None:
@@ -542,9 +632,15 @@ class Interface(App):
         # Get appropriate value type
         val = Utils.typedStringToValue(event.value, event.input.type)
 
-        # Update
-        self._commands[event.input.id] = val
-        self.log(debug=f"Text changed: {event.input.id} -> {val} ({type(val)})")
+        # Skip no-op changes like retyping the stored value
+        if val == self._pendingUpdates.get(event.input.id, self._commands.get(event.input.id)):
+            return
+
+        # Coalesce bursts of keystrokes into a single store update
+        self._pendingUpdates[event.input.id] = val
+        if self._flushTimer is not None:
+            self._flushTimer.stop()
+        self._flushTimer = self.set_timer(0.05, self._flushCommands)
 
     @on(InputList.InputChanged, f".{CLASS_INPUT_LIST}")
     def inputListItemChanged(self, event: InputList.InputChanged) -> None:
@@ -553,7 +649,8 @@ class Interface(App):
         """
         # Update the command
         self._commands[event.sender.getAction().dest] = event.sender.getValues()
-        self.log(debug=f"List Input changed: {event.input.id} -> {event.value} ({type(event.value)})")
+        if self._debugLog:
+            self.log(debug=f"List Input changed: {event.input.id} -> {event.value} ({type(event.value)})")
 
     @on(InputList.InputAdded, f".{CLASS_INPUT_LIST}")
     def inputListAddButtonPressed(self, event: InputList.InputAdded) -> None:
@@ -562,6 +659,7 @@ class Interface(App):
         """
         # Update the command
         self._commands[event.sender.getAction().dest] = event.sender.getValues()
+        self._validDestsDirty = True
 
     @on(InputList.InputRemoved, f".{CLASS_INPUT_LIST}")
     def inputListRemoveButtonPressed(self, event: InputList.InputRemoved) -> None:
@@ -570,17 +668,23 @@ class Interface(App):
         """
         # Update the command
         self._commands[event.sender.getAction().dest] = event.sender.getValues()
+        self._validDestsDirty = True
 
     @on(TabbedContent.TabActivated, f".{CLASS_SUBPARSER_TAB_BOX}")
     def tabActivated(self, event: TabbedContent.TabActivated) -> None:
         """
         Triggered when a tab is activated.
         """
-        # Get the target
-        dest, tabId = event.tab.id.rsplit("-", 1)[-1].split("_")
+        # Get the target recorded at pane creation instead of parsing the composite tab id
+        paneId = event.tabbed_content.get_pane(event.tab).id
+        dest, tabId = self._tabTargets[paneId]
+
+        # Build the pane content on first activation
+        self._installLazySubparserContent(paneId)
 
         # Update the command
         self._commands[dest] = tabId
+        self._validDestsDirty = True
 
     @on(Button.Pressed, f"#{ID_SUBMIT_BTN}")
     def submitButtonPressed(self, event: Button.Pressed) -> None:
@@ -4,8 +4,6 @@
 # MARK: Imports
 import logging
 
-from textual.logging import TextualHandler
-
 # MARK: Constants
 LOG_TO_FILE = False
 LOG_FILENAME = "argui.log"
@@ -23,6 +21,12 @@ def getLogger(level: int, name: str = LOGGER_NAME) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    # Only configure handlers once; repeated calls just retarget the level
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.setLevel(level)
+        return logger
+
     # Setup log handler
     logHandler = logging.StreamHandler()
     logHandler.setLevel(level)
@@ -32,9 +36,6 @@ def getLogger(level: int, name: str = LOGGER_NAME) -> logging.Logger:
 
     logger.addHandler(logHandler)
 
-    # Setup Textual's log handler
-    logger.addHandler(TextualHandler())
-
     # Setup file log
     if LOG_TO_FILE:
         fileHandler = logging.FileHandler(LOG_FILENAME)
@@ -43,3 +44,15 @@ def getLogger(level: int, name: str = LOGGER_NAME) -> logging.Logger:
         logger.addHandler(fileHandler)
 
     return logger
+
+def attachTextualHandler(logger: logging.Logger) -> None:
+    """
+    Adds Textual's log handler to the given logger if it isn't already attached.
+    Kept out of `getLogger` so cli-only runs never import the Textual stack; call this when the gui is actually launched.
+
+    logger: The logger to attach the handler to.
+    """
+    from textual.logging import TextualHandler
+
+    if not any(isinstance(handler, TextualHandler) for handler in logger.handlers):
+        logger.addHandler(TextualHandler())
@@ -2,8 +2,8 @@
 # A utility object that represents an `argparse.ArgumentParser` group in a more accessible way.
 
 # MARK: Imports
-import uuid
 import argparse
+import itertools
 from typing import Optional, Iterable
 
 # MARK: Classes
@@ -11,6 +11,11 @@ class ParserGroup:
     """
     A utility object that represents an `argparse.ArgumentParser` group in a more accessible way.
     """
+    # Constants
+    __slots__ = ("id", "title", "isUuidTitle", "isExclusive", "reqActions", "optActions")
+
+    _idCounter = itertools.count() # Shared counter for unique, allocation-cheap group ids
+
     # Constructor
     def __init__(self,
         isExclusive: bool,
@@ -25,7 +30,7 @@ class ParserGroup:
         optActions: The optional actions of the group.
         """
         # Set the group id
-        self.id = f"group-{uuid.uuid4()}"
+        self.id = f"group-{next(self._idCounter)}"
 
         # Set title
         if title and (len(title.strip()) > 0):
@@ -42,7 +47,7 @@ class ParserGroup:
 
     # Python Functions
     def __str__(self) -> str:
-        params = [f"{key}={value}" for key, value in self.__dict__.items()]
+        params = [f"{key}={getattr(self, key)}" for key in self.__slots__]
         return f"ParserGroup({', '.join(params)})"
 
     def __repr__(self) -> str:
@@ -58,7 +63,7 @@ class ParserGroup:
         Returns whether an action is functionally required.
         This is different from the `required` attribute of an action.
         """
-        return action.required or (len(action.option_strings) == 0)
+        return action.required or (not action.option_strings)
 
     # Functions
     def allActions(self) -> Iterable[argparse.Action]:
@@ -2,18 +2,26 @@
 # A utility object that maps an `argparse.ArgumentParser` object in a more accessible way.
 
 # MARK: Imports
-import uuid
+import sys
 import argparse
+import weakref
+from itertools import filterfalse
 from typing import Optional, Iterable
 
 from .ParserGroup import ParserGroup
 
+# MARK: Constants
+# Parsers are immutable once set up, so their group maps can be shared between ParserMap instances
+_groupMapCache: "weakref.WeakKeyDictionary[argparse.ArgumentParser, list[ParserGroup]]" = weakref.WeakKeyDictionary()
+
 # MARK: Classes
 class ParserMap:
     """
     A utility object that maps an `argparse.ArgumentParser` object in a more accessible way.
     """
     # Constants
+    __slots__ = ("parser", "groupMap")
+
     REQ_KEY_REQ = "required"
     REQ_KEY_OPT = "optional"
 
@@ -25,7 +33,13 @@ class ParserMap:
         parser: The `argparse.ArgumentParser` object to map.
         """
         self.parser = parser
-        self.groupMap = self.mapParserGroups(parser)
+
+        # Reuse the mapped groups if this parser was mapped before
+        groupMap = _groupMapCache.get(parser)
+        if groupMap is None:
+            groupMap = self.mapParserGroups(parser)
+            _groupMapCache[parser] = groupMap
+        self.groupMap = groupMap
 
     # MARK: Static Functions
     @staticmethod
@@ -39,18 +53,16 @@ class ParserMap:
 
         Returns a list of `ParserGroup` objects.
         """
+        # Bind the per-action check to a local for the loops below
+        isActionRequired = ParserGroup.isActionRequired
+
         # Get actions of regular groups
         groups = []
-        ownedDests = {}
+        ownedGroups: dict[str, ParserGroup] = {} # { action dest : owning ParserGroup }
         for group in parser._action_groups:
-            # Get required and optional actions
-            reqActions = []
-            optActions = []
-            for action in group._group_actions:
-                if ParserGroup.isActionRequired(action):
-                    reqActions.append(action)
-                else:
-                    optActions.append(action)
+            # Partition into required and optional actions at the C level
+            reqActions = list(filter(isActionRequired, group._group_actions))
+            optActions = list(filterfalse(isActionRequired, group._group_actions))
 
             # Create ParserGroup instance
             parserGroup = ParserGroup(
@@ -61,31 +73,28 @@ class ParserMap:
             )
             groups.append(parserGroup)
 
-            # Record dest if in general bucket
+            # Record the owning group for each dest
             for action in group._group_actions:
-                ownedDests[action.dest] = group.title
+                ownedGroups[action.dest] = parserGroup
 
         # Get actions of mutually exclusive groups
+        movedActionIds: set[int] = set() # Actions to drop from the "options" group
         for mutExGroup in parser._mutually_exclusive_groups:
             # Create ParserGroup instance
             reqActions = []
             optActions = []
             for action in mutExGroup._group_actions:
                 # Check if action should be recorded
-                if action.dest in ownedDests.keys():
-                    # Check if in options
-                    if (ownedDests[action.dest] == "options"):
-                        # Remove from options
-                        for group in groups:
-                            if group.title == "options":
-                                group.optActions.remove(action)
-                                break
-
-                        # Add to this group
-                        if ParserGroup.isActionRequired(action):
-                            reqActions.append(action)
-                        else:
-                            optActions.append(action)
+                owner = ownedGroups.get(action.dest)
+                if (owner is not None) and (owner.title == "options"):
+                    # Mark for removal from options
+                    movedActionIds.add(id(action))
+
+                    # Add to this group
+                    if isActionRequired(action):
+                        reqActions.append(action)
+                    else:
+                        optActions.append(action)
 
             # Only add the group if it has actions
             if reqActions or optActions:
@@ -96,6 +105,17 @@ class ParserMap:
                 )
                 groups.append(parserGroup)
 
+        # Rebuild the options lists once to apply the removals
+        if movedActionIds:
+            for group in groups:
+                if group.title == "options":
+                    group.optActions = [a for a in group.optActions if id(a) not in movedActionIds]
+
+        # Freeze the partitions; nothing mutates them after mapping and tuples are cheaper to iterate and share
+        for group in groups:
+            group.reqActions = tuple(group.reqActions)
+            group.optActions = tuple(group.optActions)
+
         return groups
 
     @staticmethod
@@ -107,7 +127,9 @@ class ParserMap:
         """
         Generator that excludes actions by their destination.
         """
-        return (a for a in actions if not (any(opt in excludes for opt in a.option_strings) or (isinstance(a, argparse._HelpAction) and not keepHelp)))
+        excludesSet = frozenset(excludes or ())
+        helpAction = argparse._HelpAction # Local binding skips the module attribute lookup per action
+        return (a for a in actions if not (any(opt in excludesSet for opt in a.option_strings) or ((type(a) is helpAction) and not keepHelp)))
 
     # MARK: Functions
     def allActions(self) -> list[argparse.Action]:
@@ -132,21 +154,25 @@ class ParserMap:
         """
         Prints the group map to the console.
         """
+        # Build the output in memory so it hits stdout in a single write
+        lines = []
         for group in self.groupMap:
             if group.isExclusive:
                 infoText = "(exclusive)"
             else:
                 infoText = ""
-            print(f"Group: {group.title} {infoText}")
-            print(f"\tRequired:")
+            lines.append(f"Group: {group.title} {infoText}")
+            lines.append("\tRequired:")
             if group.reqActions:
                 for action in group.reqActions:
-                    print(f"\t\t{action.dest}")
+                    lines.append(f"\t\t{action.dest}")
             else:
-                print(f"\t\tno items")
-            print(f"\tOptional:")
+                lines.append("\t\tno items")
+            lines.append("\tOptional:")
             if group.optActions:
                 for action in group.optActions:
-                    print(f"\t\t{action.dest}")
+                    lines.append(f"\t\t{action.dest}")
             else:
-                print(f"\t\tno items")
+                lines.append("\t\tno items")
+
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -30,6 +30,12 @@ def codeStrToTitle(s: str) -> str:
     """
     return toTitleCase(splitCamelCase(splitSnakeCase(s)))
 
+# Converters for `typedStringToValue` keyed by the Textual `Input.type` value
+_TYPED_CONVERTERS = {
+    "integer": int,
+    "number": float
+}
+
 def typedStringToValue(s: str, inputType: str) -> Optional[Union[str, int, float]]:
     """
     Converts a typed input string into an `int`, `float`, the `s` string, or `None`.
@@ -39,13 +45,13 @@ def typedStringToValue(s: str, inputType: str) -> Optional[Union[str, int, float
 
     Returns the converted value.
     """
+    # Resolve the converter with a single lookup
+    converter = _TYPED_CONVERTERS.get(inputType)
+    if converter is None:
+        return s
+
     try:
-        if inputType == "integer":
-            return int(s)
-        elif inputType == "number":
-            return float(s)
-        else:
-            return s
+        return converter(s)
     except ValueError:
         return None
 
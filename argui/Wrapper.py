@@ -2,12 +2,12 @@
 # Host wrapper for the Interface.
 
 # MARK: Imports
+import sys
 import argparse
 import logging
 from typing import Optional
 
-from .Interface import Interface
-from .Logging import getLogger
+from .Logging import getLogger, attachTextualHandler
 from .ReturnCodes import ReturnCodes
 
 # MARK: Classes
@@ -55,15 +55,13 @@ class Wrapper:
 
         Returns any parsed arguments as an `argparse.Namespace` object or `None` if the gui was quit without submitting.
         """
-        # Create gui argument parser
-        guiArgParser = argparse.ArgumentParser(add_help=False)
-        self._addGuiArgument(guiArgParser)
+        # Check if the gui flag is present with a cheap scan; the full parse only runs on the branch taken
+        # Tokens after the "--" end-of-options separator are positionals and must not trigger the gui
+        argv = sys.argv[1:]
+        if "--" in argv:
+            argv = argv[:argv.index("--")]
 
-        # Parse the cli args
-        args = guiArgParser.parse_known_args()[0]
-
-        # Check if the gui flag is present
-        if hasattr(args, self.guiFlag.lstrip("-")) and getattr(args, self.guiFlag.lstrip("-")):
+        if self.guiFlag in argv:
             # Get args from gui
             self._logger.info("Starting the gui.")
             return self.parseArgsWithGui()
@@ -79,6 +77,12 @@ class Wrapper:
 
         Returns any parsed arguments as an `argparse.Namespace` object or `None` if the gui was quit without submitting.
         """
+        # Defer the Textual stack until the gui is actually requested
+        from .Interface import Interface
+
+        # Route log output through Textual now that its stack is loaded
+        attachTextualHandler(self._logger)
+
         # Startup the Gui
         gui = Interface(
             self._parser,
@@ -110,5 +114,9 @@ class Wrapper:
 
         parser: The parser to add the argument to.
         """
+        # Skip if the flag is already registered (eg. a parser shared between Wrapper instances)
+        if any((self.guiFlag in action.option_strings) for action in parser._actions):
+            return
+
         # Add the argument
         parser.add_argument(self.guiFlag, action="store_true", help=self.guiHelp)
@@ -1,7 +1,13 @@
 # Argparse Interface
 from .Wrapper import Wrapper
-from .Interface import Interface
 from .ParserMap import ParserMap
 from .Demo import getDemoArgParser, runDemo
 from .ReturnCodes import ReturnCodes
 from . import Utils
+
+def __getattr__(name: str):
+    # Defer the Textual-backed Interface so cli-only runs don't pay for the gui stack
+    if name == "Interface":
+        from .Interface import Interface
+        return Interface
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 # A `ModalScreen` object for providing a basic prompt to the user.
 
 # MARK: Imports
-import os
+from pathlib import Path
 from typing import Iterable
 
 from textual import on
@@ -11,13 +11,17 @@ from textual.containers import Vertical, Grid
 from textual.screen import ModalScreen
 from textual.widgets import Label, Button
 
+# MARK: Constants
+# Read once at import so each modal mount uses the in-memory stylesheet
+_CSS_TEXT = (Path(__file__).parent.parent / "style" / "AlertModal.tcss").read_text(encoding="utf-8")
+
 # MARK: Classes
 class AlertModal(ModalScreen[Button.Pressed]):
     """
     A `ModalScreen` object for providing a basic prompt to the user.
     """
     # Constants
-    CSS_PATH = os.path.join(os.path.dirname(__file__), "..", "style", "AlertModal.tcss")
+    CSS = _CSS_TEXT
     ID_ALERT_ROOT = "alertModal"
     CLASS_ALERT_BTN = "alertButton"
 
@@ -34,19 +38,21 @@ class AlertModal(ModalScreen[Button.Pressed]):
 
         # Record data
         self._message = message
-        self._buttons = buttons
+        self._buttons = tuple(buttons) # Materialized so `len` is valid and iteration is repeatable
 
         # Add button class
+        btnClass = self.CLASS_ALERT_BTN
         for btn in self._buttons:
-            btn.add_class(self.CLASS_ALERT_BTN)
-
-        # Update button grid
-        CSS = f".{self.ID_ALERT_ROOT} > Grid " + "{" + f"grid-size: {len(buttons)} 1;" + "}"
+            btn.add_class(btnClass)
 
     def compose(self) -> ComposeResult:
+        # Size the button grid to the button count
+        grid = Grid(*self._buttons)
+        grid.styles.grid_size_columns = len(self._buttons)
+
         yield Vertical(
             Label(self._message),
-            Grid(*self._buttons),
+            grid,
             id=self.ID_ALERT_ROOT
         )
 
@@ -3,24 +3,81 @@
 
 # MARK: Imports
 import os
+import stat
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, Optional
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, DirectoryTree
+from textual.widgets.directory_tree import DirEntry
+from textual.widgets.tree import TreeNode
 
 from ..types import FileSelectFile, FileSelectDir
 
+# MARK: Functions
+@functools.lru_cache(maxsize=512)
+def _resolvePath(path: str) -> Path:
+    """
+    Returns the expanded and resolved form of the given `path` string.
+    Memoized because navigation re-resolves the same paths repeatedly and each resolve stats every path component.
+    """
+    return Path(path).expanduser().resolve()
+
+@functools.lru_cache(maxsize=1)
+def _home() -> Path:
+    """
+    Returns the user's resolved home directory, computed once; `Path.home()` hits the passwd database on every call.
+    """
+    return Path.home().resolve()
+
+@functools.lru_cache(maxsize=256)
+def _listDirCached(path: str, mtimeNs: int) -> tuple[Path, ...]:
+    """
+    Returns the sorted entries of the directory at `path` with directories first.
+
+    `mtimeNs` is part of the cache key so that a directory that changed on disk is re-scanned while unchanged directories are served from memory.
+    """
+    try:
+        return tuple(sorted(
+            Path(path).iterdir(),
+            key=lambda entry: (not DirectoryTree._safe_is_dir(entry), entry.name.lower())
+        ))
+    except PermissionError:
+        return ()
+
+def _dirCacheKey(path: Path) -> tuple[str, int]:
+    """
+    Returns the `(path, mtime_ns)` cache key for the directory at `path` for use with `_listDirCached`.
+    """
+    try:
+        mtimeNs = os.stat(path).st_mtime_ns
+    except OSError:
+        mtimeNs = 0
+    return (str(path), mtimeNs)
+
 # MARK: Classes
+class CachedDirectoryTree(DirectoryTree):
+    """
+    A `DirectoryTree` that serves repeat directory visits from an in-memory listing cache instead of re-scanning the disk each time.
+    """
+    @work(thread=True, exit_on_error=False)
+    def _load_directory(self, node: TreeNode[DirEntry]) -> list[Path]:
+        # Entries come back pre-sorted from the cache so revisits skip both the scandir and the per-entry stat sort
+        assert node.data is not None
+        return list(self.filter_paths(_listDirCached(*_dirCacheKey(_resolvePath(str(node.data.path))))))
+
 class FileSelectModal(ModalScreen[Optional[Path]]):
     """
     A modal allowing the user to select a file or directory from the file system.
     """
     # Constants
-    CSS_PATH = os.path.join(os.path.dirname(__file__), "..", "style", "FileSelectModal.tcss")
+    CSS_PATH = str((Path(__file__).parent.parent / "style" / "FileSelectModal.tcss").resolve()) # Pre-normalized so Textual's loader doesn't re-resolve ".."
 
     ID_FILE_SELECT_ROOT = "fsModal"
     ID_PATH_BAR = "fsModalPathBar"
@@ -32,6 +89,8 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
     ID_CANCEL_BTN = "fsModalCancelButton"
     ID_SELECT_BTN = "fsModalSelectButton"
 
+    PREFETCH_LIMIT = 16 # Max child directories to scan ahead per navigation
+
     # Lifecycle
     def __init__(self,
         startPath: Optional[Union[str, Path]],
@@ -46,7 +105,7 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
 
         # Setup start path
         if startPath is None:
-            self._startPath = self.fullpath(Path.home())
+            self._startPath = _home()
         else:
             self._startPath = self.fullpath(startPath)
 
@@ -67,6 +126,13 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
         self._dirTree: Optional[DirectoryTree] = None # Set in `compose`
         self._pathInput: Optional[Input] = None # Set in `compose`
 
+        # Prefetch pool for scanning ahead of the user's navigation
+        self._prefetchPool = ThreadPoolExecutor(max_workers=4)
+
+    def on_unmount(self) -> None:
+        # Drop any prefetches still queued; the cache keeps whatever finished
+        self._prefetchPool.shutdown(wait=False, cancel_futures=True)
+
     def compose(self) -> ComposeResult:
         # Decide select button text
         if isinstance(self.selectType, FileSelectFile):
@@ -77,14 +143,14 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
             selectText = "Select"
 
         # Prepare the dir tree
-        self._dirTree = DirectoryTree(
+        self._dirTree = CachedDirectoryTree(
             self._startPath,
             id=self.ID_FILE_TREE
         )
 
         # Prepare the path input
         self._pathInput = Input( # TODO: Add file path validator?
-            value=str(self.fullpath(self._startPath)),
+            value=str(self._startPath), # Already resolved in `__init__`
             placeholder="~/foo/bar",
             id=self.ID_PATH_INPUT
         )
@@ -126,7 +192,21 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
         """
         Returns the true full path of the given `path`.
         """
-        return Path(path).expanduser().resolve()
+        return _resolvePath(str(path))
+
+    def _prefetchChildren(self, path: Path) -> None:
+        """
+        Scans up to `PREFETCH_LIMIT` child directories of `path` into the listing cache so the user's next navigation hits memory.
+
+        path: The directory whose children should be prefetched.
+        """
+        prefetched = 0
+        for entry in _listDirCached(*_dirCacheKey(path)):
+            if DirectoryTree._safe_is_dir(entry):
+                self._prefetchPool.submit(_listDirCached, *_dirCacheKey(entry))
+                prefetched += 1
+                if prefetched >= self.PREFETCH_LIMIT:
+                    break
 
     def goToPath(self, path: Union[str, Path], refreshForFile: bool = False) -> None:
         """
@@ -136,14 +216,34 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
         path: A path to navigate to. File or directory.
         refreshForFile: If `True`, the directory tree will refresh it's content based on the directory the file is in. Otherwise, only the directory tree itself won't be changed.
         """
+        # Tree events and the navigation buttons hand over already-resolved absolute paths; only resolve relative input
+        # The selected path is re-resolved at dismissal, so an unnormalized absolute path here only ever reaches the display
+        newPath = Path(path)
+        if not newPath.is_absolute():
+            newPath = self.fullpath(newPath)
+
+        # Short-circuit no-op navigation; re-selecting the current path would rebuild the directory tree for nothing
+        if newPath == self.__curPath:
+            return
+
         # Update the current path
-        self.__curPath = self.fullpath(path)
+        self.__curPath = newPath
+
+        # One stat decides the branch; `is_dir` and `is_file` would each issue their own
+        try:
+            pathMode = os.stat(self.__curPath).st_mode
+        except OSError:
+            pathMode = 0
 
         # Check if the path is a directory
-        if self.__curPath.is_dir():
+        if stat.S_ISDIR(pathMode):
             # Enter the directory
-            self._dirTree.path = str(self.__curPath)
-        elif (refreshForFile and self.__curPath.is_file()):
+            if str(self._dirTree.path) != str(self.__curPath):
+                self._dirTree.path = str(self.__curPath)
+
+            # Scan ahead into the children while the user decides where to go next
+            self._prefetchPool.submit(self._prefetchChildren, self.__curPath)
+        elif (refreshForFile and stat.S_ISREG(pathMode)):
             # Enter the parent directory
             self._dirTree.path = str(self.fullpath(self.__curPath.parent))
 
@@ -168,12 +268,15 @@ class FileSelectModal(ModalScreen[Optional[Path]]):
         self.goToPath(upPath)
 
     @on(Button.Pressed, f"#{ID_GO_PATH_BTN}")
-    def pathGoButtonPressed(self, event: Button.Pressed) -> None:
+    async def pathGoButtonPressed(self, event: Button.Pressed) -> None:
         """
         Triggered when the up directory button is pressed.
         """
+        # Resolve the typed path off the event loop; on slow mounts the component stats would otherwise stall rendering
+        path = await asyncio.to_thread(self.fullpath, self._pathInput.value)
+
         # Go to it
-        self.goToPath(self._pathInput.value, refreshForFile=True)
+        self.goToPath(path, refreshForFile=True)
 
     @on(Button.Pressed, f"#{ID_CANCEL_BTN}")
     def cancelButtonPressed(self, event: Button.Pressed) -> None:
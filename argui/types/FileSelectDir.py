@@ -17,6 +17,9 @@ class FileSelectDir(MetaType):
     No unnamed arguments can be provided to this class.
     Providing any will raise an `argparse.ArgumentTypeError` as this indicates the user is trying to use this class incorrectly.
     """
+    # Constants
+    __slots__ = ()
+
     # Python Functions
     def __call__(self, value: str) -> Path:
         # Get the path
@@ -2,6 +2,8 @@
 # A meta type that indicates the interface should only accept files.
 
 # MARK: Imports
+import os
+import stat
 import argparse
 from pathlib import Path
 from typing import Optional, Iterable
@@ -18,6 +20,9 @@ class FileSelectFile(MetaType):
     No unnamed arguments can be provided to this class.
     Providing any will raise an `argparse.ArgumentTypeError` as this indicates the user is trying to use this class incorrectly.
     """
+    # Constants
+    __slots__ = ("validExts", "_validExtsDotted")
+
     # Constructor
     def __init__(self, *args, exts: Optional[Iterable[str]] = None):
         """
@@ -27,7 +32,13 @@ class FileSelectFile(MetaType):
         super().__init__(*args)
 
         # Setup file extensions
-        self.validExts = exts
+        if exts is None:
+            self.validExts = None
+            self._validExtsDotted = None
+        else:
+            # Keep the given order for display and precompute a set of dotted suffixes for O(1) matching
+            self.validExts = tuple(exts)
+            self._validExtsDotted = frozenset(f".{ext.lower().lstrip('.')}" for ext in self.validExts)
 
     # Python Functions
     def __call__(self, value: str) -> Path:
@@ -37,14 +48,18 @@ class FileSelectFile(MetaType):
         except:
             raise argparse.ArgumentTypeError(f"Value is not a file system path: {value}")
 
-        # Check if the path is a file
-        if not path.is_file():
+        # Check if the path is a file with a single stat call
+        try:
+            isFile = stat.S_ISREG(os.stat(path).st_mode)
+        except OSError:
+            isFile = False
+        if not isFile:
             raise argparse.ArgumentTypeError(f"Path does not indicate a file: {path}")
 
         # Check file extensions
         if self.validExts is not None:
-            cleanExt = path.suffix.lower().lstrip(".")
-            if cleanExt not in [ext.lower().lstrip(".") for ext in self.validExts]:
+            if path.suffix.lower() not in self._validExtsDotted:
+                cleanExt = path.suffix.lower().lstrip(".")
                 raise argparse.ArgumentTypeError(f"File extension `.{cleanExt}` is not a valid extension for this argument. Valid extensions are: {', '.join(self.validExts)}")
 
         return path
@@ -15,6 +15,9 @@ class MetaType:
     No unnamed arguments can be provided to this class.
     Providing any will raise an `argparse.ArgumentTypeError` as this indicates the user is trying to use this class incorrectly.
     """
+    # Constants
+    __slots__ = () # Empty so subclasses can declare their own slots without re-adding a `__dict__`
+
     # Constructor
     def __init__(self, *args):
         # Check if used incorrectly
@@ -14,7 +14,7 @@ from textual.containers import Horizontal
 from textual.message import Message
 
 from .. import Utils
-from ..modals.FileSelectModal import FileSelectModal
+from ..modals.FileSelectModal import FileSelectModal, _dirCacheKey, _home, _listDirCached
 from ..modals.AlertModal import AlertModal
 from ..types import FileSelectFile, FileSelectDir
 
@@ -57,7 +57,7 @@ class FileSelect(Widget):
         super().__init__(
             name=name,
             id=id,
-            classes=((classes or "") + f" {self.CLASS_FILESELECT_ROOT}").strip(),
+            classes=(f"{classes} {self.CLASS_FILESELECT_ROOT}" if classes else self.CLASS_FILESELECT_ROOT),
             disabled=disabled
         )
 
@@ -70,6 +70,10 @@ class FileSelect(Widget):
 
         self.__linkLabel: Optional[Link] = None # Populated in `compose()`
 
+    def on_mount(self) -> None:
+        # Warm the modal's listing cache off-thread so the first paint after a click serves from memory
+        self.run_worker(self._prewarmStartPath, thread=True, exclusive=False)
+
     def compose(self):
         # Decide tooltip
         if isinstance(self.selectType, FileSelectDir):
@@ -147,6 +151,12 @@ class FileSelect(Widget):
             return self.sender
 
     # MARK: Functions
+    def _prewarmStartPath(self) -> None:
+        """
+        Scans the file select modal's default start directory into the shared listing cache.
+        """
+        _listDirCached(*_dirCacheKey(_home()))
+
     def getPath(self) -> Path:
         """
         Returns the current path of the file select.
@@ -17,20 +17,23 @@ CLASS_SWITCH = "switchInput"
 CLASS_DROPDOWN = "dropdownInput"
 CLASS_TYPED_TEXT = "textInput"
 
+_CHOICE_OPTIONS_CACHE: dict[int, tuple] = {} # { id(action.choices) : (choices object, options tuple) }; the stored object pins the id and is identity-checked on hit
+_NUMBER_VALIDATORS = (Number(),) # Validators are stateless so every numeric input shares this one
+
 # MARK: Functions
-def buildSwitchInput(action: argparse.Action):
+def buildSwitchInput(action: argparse.Action) -> Vertical:
     """
-    Yields a switch input for the given `action`.
+    Returns a switch input group for the given `action`.
 
     action: The `argparse` action to build from.
     """
     # Add a switch
-    yield Vertical(
+    return Vertical(
         Label(Utils.codeStrToTitle(action.dest), classes="inputLabel"),
         Label((action.help or f"Supply \"{action.metavar}\"."), classes="inputHelp"),
         Switch(
             # If by providing the flag the result value is False, then the switch should be the opposite
-            value=isinstance(action, argparse._StoreFalseAction),
+            value=(type(action) is argparse._StoreFalseAction),
             tooltip=action.help,
             id=action.dest,
             classes=CLASS_SWITCH
@@ -38,18 +41,27 @@ def buildSwitchInput(action: argparse.Action):
         classes="inputContainer"
     )
 
-def buildDropdownInput(action: argparse.Action):
+def buildDropdownInput(action: argparse.Action) -> Vertical:
     """
-    Yields a dropdown (select) input for the given `action`.
+    Returns a dropdown (select) input group for the given `action`.
 
     action: The `argparse` action to build from.
     """
+    # Get the interned options for these choices, guarding against a recycled id from a collected parser
+    cacheKey = id(action.choices)
+    cached = _CHOICE_OPTIONS_CACHE.get(cacheKey)
+    if (cached is not None) and (cached[0] is action.choices):
+        options = cached[1]
+    else:
+        options = tuple((str(c), c) for c in action.choices)
+        _CHOICE_OPTIONS_CACHE[cacheKey] = (action.choices, options)
+
     # Add select dropdown
-    yield Vertical(
+    return Vertical(
         Label(Utils.codeStrToTitle(action.dest), classes="inputLabel"),
         Label((action.help or f"Supply \"{action.metavar}\"."), classes="inputHelp"),
         Select(
-            options=[(str(c), c) for c in action.choices],
+            options=options,
             value=(action.default if (action.default is not None) else action.choices[0]),
             tooltip=action.help,
             id=action.dest,
@@ -77,11 +89,7 @@ def createInput(
     metavarIndex: The index of the `action.metavar` to use for the placeholder when the `action.metavar` is a tuple.
     """
     # Decide validators
-    validators = None
-    if action.type == int:
-        validators = [Number()]
-    elif action.type == float:
-        validators = [Number()]
+    validators = (_NUMBER_VALIDATORS if (action.type in (int, float)) else None)
 
     # Decide placeholder
     if isinstance(action.metavar, tuple):
@@ -101,9 +109,9 @@ def createInput(
         validators=validators
     )
 
-def buildTypedInput(action: argparse.Action, inputType: str = "text"):
+def buildTypedInput(action: argparse.Action, inputType: str = "text") -> Vertical:
     """
-    Yields a typed text input group for the given `action`.
+    Returns a typed text input group for the given `action`.
     For just the `Input` object, use `createInput(...)`.
 
     action: The `argparse` action to build from.
@@ -111,7 +119,7 @@ def buildTypedInput(action: argparse.Action, inputType: str = "text"):
     hideLabel: If `True`, the label will be hidden.
     """
     # Add a typed input
-    yield Vertical(
+    return Vertical(
         Label(Utils.codeStrToTitle(action.dest), classes="inputLabel"),
         Label((action.help or f"Supply \"{action.metavar}\"."), classes="inputHelp"),
         createInput(
@@ -123,15 +131,15 @@ def buildTypedInput(action: argparse.Action, inputType: str = "text"):
         classes="inputContainer"
     )
 
-def buildFileSelectInput(action: argparse.Action):
+def buildFileSelectInput(action: argparse.Action) -> Vertical:
     """
-    Yields an initial interface for a file select input that allows the file select modal to be opened.
+    Returns an initial interface for a file select input that allows the file select modal to be opened.
     Also tracks the selected file path.
 
     action: The `argparse` action to build from.
     """
     # Add a file select input
-    yield Vertical(
+    return Vertical(
         Label(Utils.codeStrToTitle(action.dest), classes="inputLabel"),
         Label((action.help or f"Supply \"{action.metavar}\"."), classes="inputHelp"),
         FileSelect(
@@ -2,8 +2,8 @@
 # A widget for rendering and managing a list of input fields for an Action.
 
 # MARK: Imports
-import uuid
 import argparse
+import itertools
 from pathlib import Path
 from typing import Optional, Any
 
@@ -18,6 +18,9 @@ from . import InputBuilders
 from .FileSelect import FileSelect
 from .. import Utils
 
+# MARK: Constants
+_INPUT_TYPE_MAP = {int: "integer", float: "number"} # { action type : Input type }; anything else is "text"
+
 # MARK: Classes
 class InputList(Widget):
     """
@@ -31,6 +34,8 @@ class InputList(Widget):
     CLASS_LIST_INPUT_TEXT = "listInputText"
     CLASS_LIST_INPUT_PATH = "listInputPath"
 
+    TOOLTIP_RM_BTN = "Remove item"
+
     DEFAULT_CSS = """
     InputList {
         height: auto;
@@ -67,34 +72,42 @@ class InputList(Widget):
         self.showAddRemove = showAddRemove
         self._action = action
         self._defaults = defaults
-        self._inputs: dict[str, Widget] = {} # { inputId: item }
-        self._values: dict[str, Any] = {} # { inputId: value }
+        self._title = Utils.codeStrToTitle(action.dest) # The dest never changes so the title is computed once
+        self._idPrefix = f"{action.dest}_" # Shared prefix for every item id built below
+        self._inputs: dict[int, Widget] = {} # { inputId: item }
+        self._values: dict[int, Any] = {} # { inputId: value }
+        self._itemTargets: dict[str, tuple[str, int]] = {} # { item widget name: (dest, inputId) }
+        self._itemIdCounter = itertools.count() # Local uniqueness is all the item ids need
+        self._itemBox: Optional[Vertical] = None # Set in `compose`
+        self._addBtn: Optional[Button] = None # Set in `compose` when `showAddRemove`
 
         self._prepareInputs()
 
     def compose(self):
-        # Prep the core elements
+        # Prep the core elements; keep direct references so handlers skip the DOM walks
+        self._itemBox = Vertical(
+            *self._inputs.values(),
+            id=self._action.dest,
+            classes=self.CLASS_LIST_INPUT_BOX
+        )
         uiItems = [
-            Label(Utils.codeStrToTitle(self._action.dest), classes="inputLabel"),
+            Label(self._title, classes="inputLabel"),
             Label((self._action.help or f"Supply \"{self._action.metavar}\"."), classes="inputHelp"),
-            Vertical(
-                *self._inputs.values(),
-                id=self._action.dest,
-                classes=self.CLASS_LIST_INPUT_BOX
-            )
+            self._itemBox
         ]
 
         # Yield the add button if enabled
         if self.showAddRemove:
-            uiItems.append(Button(
+            self._addBtn = Button(
                 "Add +",
                 id=f"{self._action.dest}_add",
                 name=self._action.dest,
                 variant="primary",
-                classes=f"{self.CLASS_LIST_ADD_BTN}",
-                tooltip=f"Add a new item to {Utils.codeStrToTitle(self._action.dest)}",
+                classes=self.CLASS_LIST_ADD_BTN,
+                tooltip=f"Add a new item to {self._title}",
                 disabled=((len(self._inputs) >= self._action.nargs) if isinstance(self._action.nargs, int) else False)
-            ))
+            )
+            uiItems.append(self._addBtn)
 
         # Yield the UI elements
         yield Vertical(
@@ -170,11 +183,11 @@ class InputList(Widget):
         Builds the `self._inputs` for the current `self._action`.
         """
         # Add default values if present
-        if isinstance(self._defaults, list):
+        if type(self._defaults) is list:
             # Process the default values
             for i, val in enumerate(self._defaults):
                 # Get item id
-                inputId = str(uuid.uuid4())
+                inputId = next(self._itemIdCounter)
 
                 # Add the UI item to items
                 self._inputs[inputId] = self._buildListInputItem(
@@ -191,9 +204,9 @@ class InputList(Widget):
         # Add remaining inputs for nargs
         itemCount = len(self._inputs)
         if isinstance(self._action.nargs, int) and (itemCount < self._action.nargs):
-            for i in range(itemCount, (self._action.nargs - itemCount)):
+            for i in range(itemCount, self._action.nargs):
                 # Get item id
-                inputId = str(uuid.uuid4())
+                inputId = next(self._itemIdCounter)
 
                 # Add the UI item to items
                 self._inputs[inputId] = self._buildListInputItem(
@@ -204,7 +217,7 @@ class InputList(Widget):
                 )
 
     def _buildListInputItem(self,
-        id: str,
+        id: int,
         action: argparse.Action,
         value: Optional[str] = None,
         showRemove: bool = True,
@@ -220,13 +233,16 @@ class InputList(Widget):
         metavarIndex: The index of the `action.metavar` to use for the placeholder when the `action.metavar` is a tuple.
         """
         # Prepare the id for this list item
-        inputId = f"{action.dest}_{id}"
+        inputId = self._idPrefix + str(id)
+
+        # Record the target so handlers don't have to parse the widget name
+        self._itemTargets[inputId] = (action.dest, id)
 
         # Update the values
         self._values[id] = value
 
         # Check if a special type
-        if action.type == Path:
+        if action.type is Path:
             # File Select input
             # Create input and children
             children = [
@@ -238,15 +254,7 @@ class InputList(Widget):
         else:
             # Standard input
             # Get proper input type
-            if action.type == int:
-                # An int input
-                inputType = "integer"
-            elif action.type == float:
-                # A float input
-                inputType = "number"
-            else:
-                # A string input
-                inputType = "text"
+            inputType = _INPUT_TYPE_MAP.get(action.type, "text")
 
             # Create input and children
             children = [
@@ -265,9 +273,9 @@ class InputList(Widget):
             children.append(Button(
                 "X",
                 name=inputId,
-                classes=f"{self.CLASS_LIST_RM_BTN}",
+                classes=self.CLASS_LIST_RM_BTN,
                 variant="error",
-                tooltip=f"Remove item"
+                tooltip=self.TOOLTIP_RM_BTN
             ))
 
         # Add a list input item
@@ -287,7 +295,7 @@ class InputList(Widget):
         event.stop()
 
         # Get the target
-        dest, id = event.input.name.split("_")
+        dest, id = self._itemTargets[event.input.name]
 
         # Update the value
         value = Utils.typedStringToValue(event.value, event.input.type)
@@ -309,7 +317,7 @@ class InputList(Widget):
         event.stop()
 
         # Get the input id
-        inputId: str = event.context
+        inputId: int = event.context
 
         # Check if a path was selected
         if isinstance(event.path, Path):
@@ -331,8 +339,8 @@ class InputList(Widget):
         # Resolve it here
         event.stop()
 
-        # Create a uuid for the new input
-        inputId = str(uuid.uuid4())
+        # Create an id for the new input
+        inputId = next(self._itemIdCounter)
 
         # Create a new input
         newInput = self._buildListInputItem(
@@ -344,7 +352,7 @@ class InputList(Widget):
         self._inputs[inputId] = newInput
 
         # Add a new item to the ui
-        self.get_widget_by_id(event.button.name).mount(newInput)
+        self._itemBox.mount(newInput)
 
         # Check if the list is full
         if isinstance(self._action.nargs, int) and (len(self._inputs) >= self._action.nargs):
@@ -365,19 +373,17 @@ class InputList(Widget):
         event.stop()
 
         # Get the target
-        dest, inputId = event.button.name.split("_")
+        dest, inputId = self._itemTargets.pop(event.button.name)
 
-        # Delete the input and value
-        del self._inputs[inputId]
+        # Delete the value and remove the item widget from the ui
+        item = self._inputs.pop(inputId)
         del self._values[inputId]
-
-        # Remove the item from the ui
-        self.get_widget_by_id(event.button.name).remove()
+        item.remove()
 
         # Check if list is no longer full
         if isinstance(self._action.nargs, int) and (len(self._inputs) < self._action.nargs):
-            if addBtn := self.get_widget_by_id(f"{dest}_add"):
-                addBtn.disabled = False
+            if self._addBtn is not None:
+                self._addBtn.disabled = False
 
         # Send the input removed message
         self.post_message(self.InputRemoved(